@@ -1,12 +1,23 @@
-from brownie import YlockerDrops, accounts, interface
 from dotenv import load_dotenv
 import os
 import json
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json if orjson isn't installed
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # Optional: read the .zst merkle variant when present
 
 # Load environment variables from .env file
 load_dotenv()
 
 def create_drop():
+    from brownie import interface
     YEAR = 60 * 60 * 24 * 365
     drops = interface.IDrops('0xfF9eCd7e63c7d0a3b1401f86f65B15488C2C46c8')
     yb = '0x01791F726B4103694969820be083196cC7c045fF'
@@ -21,9 +32,29 @@ def create_drop():
     print(f"Drop created with ID {tx.return_value}")
     return tx.return_value
 
+@lru_cache(maxsize=1)
 def yb_merkle_data():
-    """Load production YB distribution merkle data"""
+    """
+    Load production YB distribution merkle data.
+
+    Cached for the brownie session — the file is tens of MB and re-parsed
+    otherwise on every call. Use yb_merkle_data.cache_clear() after
+    regenerating the file.
+    """
     from config import Config
-    with open(Config.YB_DISTRO_FILE, 'r') as f:
-        data = json.load(f)
-    return data
+    json_path = Config.YB_DISTRO_FILE
+    zst_path = json_path + '.zst'
+    # Only trust the compressed copy when it's at least as new as the JSON —
+    # a regeneration on a machine without zstandard leaves a stale .zst
+    # behind, and this data feeds the on-chain merkle root
+    use_zst = zstandard and os.path.exists(zst_path) and (
+        not os.path.exists(json_path)
+        or os.path.getmtime(zst_path) >= os.path.getmtime(json_path)
+    )
+    if use_zst:
+        with open(zst_path, 'rb') as f:
+            raw = zstandard.ZstdDecompressor().decompress(f.read())
+    else:
+        with open(json_path, 'rb') as f:
+            raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
@@ -1,11 +1,15 @@
-from brownie import YlockerDrops, accounts, interface, Contract
+from brownie import YlockerDrops, accounts
 from dotenv import load_dotenv
 import os
-from brownie_safe import BrownieSafe
+from functools import lru_cache
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Note: brownie_safe and Contract are imported inside the functions that use
+# them — brownie_safe alone pulls in eth_account/web3 providers and adds
+# hundreds of ms to cold start for the common deploy-only path.
+
 def main():
     deployer_id = os.getenv('DEPLOYER_ID')
     print(f"Deploying with account {deployer_id}")
@@ -14,6 +18,7 @@ def main():
     print(f"Drop deployed to {drops.address}")
 
 def create_drop():
+    from brownie_safe import BrownieSafe
     safe = BrownieSafe('0x4444AAAACDBa5580282365e25b16309Bd770ce4a')
     drops = safe.contract('0xfF9eCd7e63c7d0a3b1401f86f65B15488C2C46c8')
     yb = safe.contract('0x01791F726B4103694969820be083196cC7c045fF')
@@ -32,6 +37,8 @@ def create_drop():
     safe.post_transaction(safe_tx)
 
 def claim_4a_drop():
+    from brownie import Contract
+    from brownie_safe import BrownieSafe
     yb = Contract('0x01791F726B4103694969820be083196cC7c045fF')
     safe = BrownieSafe('0x4444AAAACDBa5580282365e25b16309Bd770ce4a')
     drops = safe.contract('0xfF9eCd7e63c7d0a3b1401f86f65B15488C2C46c8')
@@ -48,6 +55,7 @@ def claim_4a_drop():
     safe.post_transaction(safe_tx)
 
 def claim_drop():
+    from brownie import Contract
     drop_id = 0
     drops = Contract('0xfF9eCd7e63c7d0a3b1401f86f65B15488C2C46c8')
     data = yb_merkle_data()
@@ -75,10 +83,38 @@ def claim_drop():
         )
         assert yb.balanceOf(account) > before_balance
 
+@lru_cache(maxsize=1)
 def yb_merkle_data():
-    """Load production YB distribution merkle data"""
+    """
+    Load production YB distribution merkle data.
+
+    Cached for the brownie session — create_drop/claim_4a_drop/claim_drop
+    each call this and would otherwise re-parse the full file. Use
+    yb_merkle_data.cache_clear() after regenerating the file.
+    """
     import json
     from config import Config
-    with open(Config.YB_DISTRO_FILE, 'r') as f:
-        data = json.load(f)
-    return data
\ No newline at end of file
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    try:
+        import zstandard
+    except ImportError:
+        zstandard = None
+    json_path = Config.YB_DISTRO_FILE
+    zst_path = json_path + '.zst'
+    # Only trust the compressed copy when it's at least as new as the JSON —
+    # a regeneration on a machine without zstandard leaves a stale .zst
+    # behind, and this data feeds the on-chain merkle root
+    use_zst = zstandard and os.path.exists(zst_path) and (
+        not os.path.exists(json_path)
+        or os.path.getmtime(zst_path) >= os.path.getmtime(json_path)
+    )
+    if use_zst:
+        with open(zst_path, 'rb') as f:
+            raw = zstandard.ZstdDecompressor().decompress(f.read())
+    else:
+        with open(json_path, 'rb') as f:
+            raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
\ No newline at end of file
@@ -1,12 +1,26 @@
-from brownie import Contract, accounts, chain, web3, multicall, ZERO_ADDRESS
-from json import dump
-from collections import defaultdict
+from brownie import Contract, accounts, web3, multicall, ZERO_ADDRESS
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain as chain_iters
+from operator import itemgetter
 from utils.constants import YCRV
+from utils.code_cache import get_code_prefixes, known_eoas
 from utils.event_cache import scan_events_with_cache
+from utils.owners_cache import load_owners, update_owners
+from utils.call_cache import block_cached_call
 import os
 import re
+import sys
+import time
 import json
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json if orjson isn't installed
 
 
 class DropConfig:
@@ -99,19 +113,20 @@ class DropConfig:
             return None
 
         pattern = re.compile(r'snapshot_(\d+)\.json')
-        snapshots = []
-
-        for filename in os.listdir(snapshot_dir):
-            match = pattern.match(filename)
-            if match:
-                block = int(match.group(1))
-                snapshots.append((block, os.path.join(snapshot_dir, filename)))
 
-        if not snapshots:
-            return None
-
-        # Return path of highest block number
-        return sorted(snapshots, key=lambda x: x[0], reverse=True)[0][1]
+        # Single scandir pass keeping only the highest block number — no
+        # full listing or sort needed
+        with os.scandir(snapshot_dir) as entries:
+            best = max(
+                (
+                    (int(match.group(1)), entry.path)
+                    for entry in entries
+                    if (match := pattern.match(entry.name))
+                ),
+                key=lambda t: t[0],
+                default=None,
+            )
+        return best[1] if best else None
 
 
 # Mapping of event types to all possible field name variants across different contracts
@@ -123,9 +138,13 @@ ADDRESS_KEYS_BY_EVENT = {
 }
 
 # Configuration constants
-MULTICALL_CHUNK_SIZE = 500  # Number of users to process per multicall batch
+MULTICALL_CHUNK_SIZE = 500  # Fallback users-per-multicall batch when no tuned size is saved
+MIN_MULTICALL_CHUNK_SIZE = 250  # Starting probe size for adaptive tuning
+MAX_MULTICALL_CHUNK_SIZE = 2000  # Upper bound; larger batches risk provider payload caps
+MULTICALL_MAX_WORKERS = 8  # Concurrent multicall chunks; keep within RPC provider rate limits
 EOF_BYTECODE_PREFIX = '0xef0100'  # EIP-3540 EOF (EVM Object Format) bytecode marker
 EOF_BYTECODE_PREFIX_NO_PREFIX = 'ef0100'  # EOF marker without 0x prefix
+VECTORIZED_EXTRACT_MIN_LOGS = 10_000  # Log count above which pandas extraction pays off
 
 def extract_addresses(logs, event):
     """
@@ -146,17 +165,121 @@ def extract_addresses(logs, event):
         Set of unique addresses found in the logs
     """
     keys = ADDRESS_KEYS_BY_EVENT.get(event, [])
+    logs = logs or []
+    if len(logs) >= VECTORIZED_EXTRACT_MIN_LOGS:
+        return _extract_addresses_vectorized(logs, keys)
+    # itemgetter fetches a key with one C-level call; missing keys are the
+    # uncommon case, so try/except beats a .get() per key per log. The
+    # tuple of getters and the local bindings keep the tight loop free of
+    # LOAD_GLOBAL and attribute lookups
+    getters = tuple(itemgetter(k) for k in keys)
     out = set()
-    for lg in logs or []:
+    add = out.add
+    zero = ZERO_ADDRESS
+    intern = sys.intern
+    for lg in logs:
         args = lg.get('args') if hasattr(lg, 'get') else getattr(lg, 'args', None)
         if not args:
             continue
-        for k in keys:
-            v = args.get(k)
-            if v and v != ZERO_ADDRESS:
-                out.add(v)
+        for g in getters:
+            try:
+                v = g(args)
+            except KeyError:
+                continue
+            if v and v != zero:
+                add(intern(str(v)))
     return out
 
+def _extract_addresses_vectorized(logs, keys):
+    """
+    Pandas fast path for extract_addresses on large log sets.
+
+    Builds one DataFrame over the log args and pulls the unique values of the
+    address columns in a single C-level pass — the per-log Python loop is the
+    bottleneck on multi-million-row Transfer scans.
+    """
+    args_list = [
+        args for args in (
+            lg.get('args') if hasattr(lg, 'get') else getattr(lg, 'args', None)
+            for lg in logs
+        ) if args
+    ]
+    if not args_list:
+        return set()
+    frame = pd.DataFrame(args_list)
+    present = [k for k in keys if k in frame.columns]
+    if not present:
+        return set()
+    values = frame[present].stack().unique()
+    return {sys.intern(str(v)) for v in values if v and v != ZERO_ADDRESS}
+
+def tune_multicall_chunk_size(items, fetch_chunk, results):
+    """
+    Probe increasing multicall batch sizes on a prefix of items.
+
+    Starts at MIN_MULTICALL_CHUNK_SIZE and doubles while the measured
+    throughput (items/sec) keeps improving, stopping on the first probe
+    that fails or slows down. Probe results are merged into `results` so
+    the consumed items don't need refetching.
+
+    Args:
+        items: Full work list (a prefix is consumed by the probes)
+        fetch_chunk: Function that processes one chunk and returns a dict
+        results: Dict that probe results are merged into
+
+    Returns:
+        Tuple of (chosen chunk size, number of items consumed)
+    """
+    size = MIN_MULTICALL_CHUNK_SIZE
+    best_size = size
+    best_rate = 0.0
+    offset = 0
+    while size <= MAX_MULTICALL_CHUNK_SIZE and offset + size <= len(items):
+        probe = items[offset:offset + size]
+        start = time.perf_counter()
+        try:
+            results.update(fetch_chunk(probe))
+        except Exception as e:
+            print(f"  [TUNE] Chunk size {size} failed ({e}), backing off")
+            break
+        offset += size
+        rate = len(probe) / max(time.perf_counter() - start, 1e-9)
+        print(f"  [TUNE] Chunk size {size}: {rate:,.0f} items/sec")
+        if rate <= best_rate:
+            break
+        best_size, best_rate = size, rate
+        size *= 2
+    return best_size, offset
+
+def fetch_chunks_parallel(items, chunk_size, fetch_chunk, label):
+    """
+    Run fetch_chunk over chunks of items concurrently and merge the results.
+
+    The chunked multicall loops are I/O-bound on JSON-RPC round trips, so
+    overlapping chunks across a thread pool hides the network latency.
+    Each worker opens its own multicall context.
+
+    Args:
+        items: Full list of items to process
+        chunk_size: Number of items per chunk
+        fetch_chunk: Callable taking a chunk and returning a dict of results
+        label: Progress label for console output
+
+    Returns:
+        Merged dict of all chunk results
+    """
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    results = {}
+    completed = 0
+    with ThreadPoolExecutor(max_workers=MULTICALL_MAX_WORKERS) as executor:
+        for chunk_result in executor.map(fetch_chunk, chunks):
+            results.update(chunk_result)
+            completed += 1
+            progress = completed / len(chunks) * 100
+            print(f"  [{progress:5.1f}%] {label}: chunk {completed}/{len(chunks)} complete")
+    return results
+
+
 def main():
     # ycrv()
     ycrv_positions()
@@ -191,32 +314,39 @@ def ycrv_positions():
     helper = Contract(YCRV['AJNA_HELPER'])
     users = set()
 
-    # Fetch all unique st-yCRV users (cached)
-    cached_st_users, st_logs = scan_events_with_cache(
-        st_ycrv, "Transfer", YCRV['ST_YCRV_DEPLOY_BLOCK'], SNAPSHOT_HEIGHT, f"ST_YCRV@{YCRV['ST_YCRV_DEPLOY_BLOCK']}..{SNAPSHOT_HEIGHT}"
-    )
+    # Fetch all unique st-yCRV users and YBS stakers (cached) — the two
+    # scans are independent, so overlap them
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        st_future = executor.submit(
+            scan_events_with_cache,
+            st_ycrv, "Transfer", YCRV['ST_YCRV_DEPLOY_BLOCK'], SNAPSHOT_HEIGHT, f"ST_YCRV@{YCRV['ST_YCRV_DEPLOY_BLOCK']}..{SNAPSHOT_HEIGHT}"
+        )
+        ybs_future = executor.submit(
+            scan_events_with_cache,
+            ybs, "Staked", YCRV['YBS_DEPLOY_BLOCK'], SNAPSHOT_HEIGHT, f"YBS@{YCRV['YBS_DEPLOY_BLOCK']}..{SNAPSHOT_HEIGHT}"
+        )
+        cached_st_users, st_logs = st_future.result()
+        cached_ybs_users, ybs_logs = ybs_future.result()
+
     st_users = extract_addresses(st_logs, "Transfer") if st_logs else cached_st_users
     users.update(st_users)
 
-    # Fetch all unique YBS stakers (cached)
-    cached_ybs_users, ybs_logs = scan_events_with_cache(
-        ybs, "Staked", YCRV['YBS_DEPLOY_BLOCK'], SNAPSHOT_HEIGHT, f"YBS@{YCRV['YBS_DEPLOY_BLOCK']}..{SNAPSHOT_HEIGHT}"
-    )
     ybs_users = extract_addresses(ybs_logs, "Staked") if ybs_logs else cached_ybs_users
-
     users.update(ybs_users)
 
-    # Calculate constant values once (avoid redundant RPC calls in loop)
-    st_ycrv_price_per_share = st_ycrv.pricePerShare(block_identifier=SNAPSHOT_HEIGHT) / 1e18
+    # Calculate constant values once (avoid redundant RPC calls in loop).
+    # These single-point reads are immutable at the pinned block, so repeat
+    # runs at the same height serve them from the disk cache
+    st_ycrv_price_per_share = block_cached_call(st_ycrv, 'pricePerShare', block=SNAPSHOT_HEIGHT) / 1e18
 
     # If include_lp is True, calculate LP-related values and fetch LP users now
     ycrv_per_share = None
     ycrv_per_lp = None
     if include_lp:
-        ycrv_in_pool = ycrv.balanceOf(YCRV['POOL'], block_identifier=SNAPSHOT_HEIGHT)
+        ycrv_in_pool = block_cached_call(ycrv, 'balanceOf', YCRV['POOL'], block=SNAPSHOT_HEIGHT)
         pool = Contract(YCRV['POOL'])
-        ycrv_per_lp = ycrv_in_pool / pool.totalSupply(block_identifier=SNAPSHOT_HEIGHT)
-        ycrv_per_share = ycrv_per_lp * lp_ycrv_v2.pricePerShare(block_identifier=SNAPSHOT_HEIGHT) / 1e18
+        ycrv_per_lp = ycrv_in_pool / block_cached_call(pool, 'totalSupply', block=SNAPSHOT_HEIGHT)
+        ycrv_per_share = ycrv_per_lp * block_cached_call(lp_ycrv_v2, 'pricePerShare', block=SNAPSHOT_HEIGHT) / 1e18
 
         # Fetch all unique lp-yCRVv2 users (cached)
         cached_lp_users, lp_logs = scan_events_with_cache(
@@ -225,44 +355,61 @@ def ycrv_positions():
         lp_users = extract_addresses(lp_logs, "Transfer") if lp_logs else cached_lp_users
         users.update(lp_users)
 
-    # Process users in chunks with multicall for better performance
+    # Process users in chunks with multicall, overlapping chunks across threads
     user_list = list(users)
-    values = {}
-
-    print(f"Processing {len(user_list)} users in chunks of {MULTICALL_CHUNK_SIZE}...")
 
-    for chunk_idx in range(0, len(user_list), MULTICALL_CHUNK_SIZE):
-        chunk = user_list[chunk_idx:chunk_idx + MULTICALL_CHUNK_SIZE]
-        progress = (chunk_idx + len(chunk)) / len(user_list) * 100
-        print(f"  [{progress:5.1f}%] Processing users {chunk_idx+1} to {chunk_idx+len(chunk)} of {len(user_list)}")
-
-        # Fetch all balances for this chunk in a single multicall
-        chunk_data = defaultdict(dict)
+    print(f"Processing {len(user_list)} users in chunks...")
+
+    def fetch_balances(chunk):
+        # Parallel arrays indexed by position in the chunk — a dict per user
+        # was pure allocation overhead for results that are read back once
+        n = len(chunk)
+        st_bals = [0] * n
+        ybs_bals = [0] * n
+        lp_bals = [0] * n
+        vanilla_bals = [0] * n
+        borrower_infos = [(0,)] * n
         with multicall(block_identifier=SNAPSHOT_HEIGHT):
-            for user in chunk:
-                chunk_data[user]['st_balance'] = st_ycrv.balanceOf(user)
+            for i, user in enumerate(chunk):
+                st_bals[i] = st_ycrv.balanceOf(user)
                 if include_ajna:
-                    chunk_data[user]['borrower_info'] = helper.borrowerInfo(YCRV['AJNA_POOL'], user)
-                else:
-                    chunk_data[user]['borrower_info'] = (0,)  # Dummy tuple
-                chunk_data[user]['ybs_balance'] = ybs.balanceOf(user)
+                    borrower_infos[i] = helper.borrowerInfo(YCRV['AJNA_POOL'], user)
+                ybs_bals[i] = ybs.balanceOf(user)
                 if include_lp:
-                    chunk_data[user]['lp_balance'] = lp_ycrv_v2.balanceOf(user)
+                    lp_bals[i] = lp_ycrv_v2.balanceOf(user)
                 if include_vanilla_ycrv:
-                    chunk_data[user]['vanilla_ycrv_balance'] = ycrv.balanceOf(user)
-
-        # Calculate final values for this chunk
-        for user in chunk:
-            value = 0
-            if include_lp:
-                value = chunk_data[user]['lp_balance'] * ycrv_per_share
-            value += chunk_data[user]['st_balance'] * st_ycrv_price_per_share
+                    vanilla_bals[i] = ycrv.balanceOf(user)
+        # Multicall results are concrete once the block exits, so the final
+        # value can be computed here in one positional pass
+        chunk_values = {}
+        for i, user in enumerate(chunk):
+            value = lp_bals[i] * ycrv_per_share if include_lp else 0
+            value += st_bals[i] * st_ycrv_price_per_share
             if include_ajna:
-                value += chunk_data[user]['borrower_info'][0]  # collateral field
-            value += chunk_data[user]['ybs_balance']
+                value += borrower_infos[i][0]  # collateral field
+            value += ybs_bals[i]
             if include_vanilla_ycrv:
-                value += chunk_data[user]['vanilla_ycrv_balance']
-            values[user] = value
+                value += vanilla_bals[i]
+            chunk_values[user] = value
+        return chunk_values
+
+    # Adaptive batch size: reuse the size learned on previous runs, otherwise
+    # probe on the first chunks and persist the winner to config.json
+    values = {}
+    chunk_size = config.get('multicall_chunk_size')
+    if not chunk_size:
+        chunk_size, consumed = tune_multicall_chunk_size(user_list, fetch_balances, values)
+        if consumed:
+            # Persist the winner so future runs skip probing
+            user_list = user_list[consumed:]
+            config['multicall_chunk_size'] = chunk_size
+            DropConfig.save_config(config)
+            print(f"Tuned multicall chunk size: {chunk_size}")
+        else:
+            # Work list too small to probe — keep the default and leave the
+            # config unset so a later full-sized run can still tune
+            chunk_size = MULTICALL_CHUNK_SIZE
+    values.update(fetch_chunks_parallel(user_list, chunk_size, fetch_balances, 'Balances'))
 
     # Handle Firm (cached)
     if include_firm:
@@ -290,96 +437,107 @@ def ycrv_positions():
         print("Skipping FIRM positions (include_firm=False)")
 
     if include_lp:
-        # Handle Curve Gauge direct deposits (cached)
         curve_gauge = Contract(YCRV['CURVE_GAUGE'])
-        cached_gauge_users, gauge_logs = scan_events_with_cache(
-            curve_gauge, "Transfer", YCRV['CURVE_GAUGE_DEPLOY_BLOCK'], SNAPSHOT_HEIGHT, f"CURVE_GAUGE@{YCRV['CURVE_GAUGE_DEPLOY_BLOCK']}..{SNAPSHOT_HEIGHT}"
-        )
+        veyfi_gauge = Contract(YCRV['VEYFI_GAUGE'])
+        sd_gauge = Contract(YCRV['SD_GAUGE'])
+        convex_deposit = Contract(YCRV['CONVEX_DEPOSIT'])
+        reward = Contract(YCRV['CONVEX_REWARD_POOL'])
+
+        # The four LP-source scans (Curve gauge, veYFI, SD, Convex) are
+        # independent and I/O-bound, so run them concurrently — the event
+        # cache serializes its own file writes
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            gauge_future = executor.submit(
+                scan_events_with_cache,
+                curve_gauge, "Transfer", YCRV['CURVE_GAUGE_DEPLOY_BLOCK'], SNAPSHOT_HEIGHT, f"CURVE_GAUGE@{YCRV['CURVE_GAUGE_DEPLOY_BLOCK']}..{SNAPSHOT_HEIGHT}"
+            )
+            veyfi_future = executor.submit(
+                scan_events_with_cache,
+                lp_ycrv_v2, "Transfer", YCRV['YGAUGE_DEPLOY_BLOCK'], SNAPSHOT_HEIGHT, f"LP_YCRV_V2_VEYFI@{YCRV['YGAUGE_DEPLOY_BLOCK']}..{SNAPSHOT_HEIGHT}",
+                search_topics={'receiver': YCRV['VEYFI_GAUGE']}
+            )
+            sd_future = executor.submit(
+                scan_events_with_cache,
+                lp_ycrv_v2, "Transfer", YCRV['SD_VAULT_DEPLOY_BLOCK'], SNAPSHOT_HEIGHT, f"LP_YCRV_V2_SD@{YCRV['SD_VAULT_DEPLOY_BLOCK']}..{SNAPSHOT_HEIGHT}",
+                search_topics={'receiver': YCRV['SD_VAULT']}
+            )
+            convex_future = executor.submit(
+                scan_events_with_cache,
+                convex_deposit, "Deposited", YCRV['CONVEX_POOL_DEPLOY_BLOCK'], SNAPSHOT_HEIGHT, f"CONVEX_DEPOSIT@{YCRV['CONVEX_POOL_DEPLOY_BLOCK']}..{SNAPSHOT_HEIGHT}"
+            )
+
+            # Handle Curve Gauge direct deposits (cached)
+            cached_gauge_users, gauge_logs = gauge_future.result()
+            # Handle veYFI Gauge (cached)
+            cached_veyfi_users, veyfi_logs = veyfi_future.result()
+            # Handle SD Vault (cached)
+            cached_sd_users, sd_logs = sd_future.result()
+            # Handle Convex (cached)
+            cached_convex_users, convex_logs = convex_future.result()
+
         gauge_users = extract_addresses(gauge_logs, "Transfer") if gauge_logs else cached_gauge_users
         # Filter out voters
         gauge_users = {u for u in gauge_users if u not in [YCRV['CONVEX_VOTER'], YCRV['YEARN_VOTER']]}
 
-        # Handle veYFI Gauge (cached)
-        veyfi_gauge = Contract(YCRV['VEYFI_GAUGE'])
-        cached_veyfi_users, veyfi_logs = scan_events_with_cache(
-            lp_ycrv_v2, "Transfer", YCRV['YGAUGE_DEPLOY_BLOCK'], SNAPSHOT_HEIGHT, f"LP_YCRV_V2_VEYFI@{YCRV['YGAUGE_DEPLOY_BLOCK']}..{SNAPSHOT_HEIGHT}",
-            search_topics={'receiver': YCRV['VEYFI_GAUGE']}
-        )
         veyfi_users = extract_addresses(veyfi_logs, "Transfer") if veyfi_logs else cached_veyfi_users
 
-        # Handle SD Vault (cached)
-        sd_gauge = Contract(YCRV['SD_GAUGE'])
-        cached_sd_users, sd_logs = scan_events_with_cache(
-            lp_ycrv_v2, "Transfer", YCRV['SD_VAULT_DEPLOY_BLOCK'], SNAPSHOT_HEIGHT, f"LP_YCRV_V2_SD@{YCRV['SD_VAULT_DEPLOY_BLOCK']}..{SNAPSHOT_HEIGHT}",
-            search_topics={'receiver': YCRV['SD_VAULT']}
-        )
         sd_users = extract_addresses(sd_logs, "Transfer") if sd_logs else cached_sd_users
-
-        # Handle Convex (cached)
-        convex_deposit = Contract(YCRV['CONVEX_DEPOSIT'])
-        reward = Contract(YCRV['CONVEX_REWARD_POOL'])
-        cached_convex_users, convex_logs = scan_events_with_cache(
-            convex_deposit, "Deposited", YCRV['CONVEX_POOL_DEPLOY_BLOCK'], SNAPSHOT_HEIGHT, f"CONVEX_DEPOSIT@{YCRV['CONVEX_POOL_DEPLOY_BLOCK']}..{SNAPSHOT_HEIGHT}"
-        )
         # Filter for specific pool (poolid=184)
         # Note: Cache doesn't filter by poolid, so we must always filter
         if convex_logs:
-            # Have new logs - extract all users first, then filter by poolid
-            all_convex_users = extract_addresses(convex_logs, "Deposited")
-            # Now filter for the specific pool
-            filtered_users = set()
+            # Have new logs - collect users for the target pool in one pass
+            pid = YCRV['CONVEX_PID']
+            convex_users = set()
             for log in convex_logs:
                 args = log.get('args') if hasattr(log, 'get') else log.args
-                poolid = args.get('poolid') if args else None
-                if poolid == YCRV['CONVEX_PID']:
-                    user = args.get('user') if args else None
+                if args and args.get('poolid') == pid:
+                    user = args.get('user')
                     if user:
-                        filtered_users.add(user)
-            convex_users = filtered_users
+                        convex_users.add(user)
         else:
             # Cache hit with no new logs - use cached users
             # Note: cached users already had poolid filtering applied in previous runs
             convex_users = cached_convex_users
 
-        # Collect all LP users with their source types
-        all_lp_users = []
-        all_lp_users.extend([('curve', user) for user in gauge_users])
-        all_lp_users.extend([('veyfi', user) for user in veyfi_users])
-        all_lp_users.extend([('sd', user) for user in sd_users])
-        all_lp_users.extend([('convex', user) for user in convex_users])
+        # Collect all LP users with their source types in one chained pass
+        all_lp_users = list(chain_iters(
+            (('curve', user) for user in gauge_users),
+            (('veyfi', user) for user in veyfi_users),
+            (('sd', user) for user in sd_users),
+            (('convex', user) for user in convex_users),
+        ))
 
         print(f"Processing {len(all_lp_users)} LP positions (Curve:{len(gauge_users)}, veYFI:{len(veyfi_users)}, SD:{len(sd_users)}, Convex:{len(convex_users)})...")
 
-        # Process LP users in chunks with multicall
+        # Process LP users in chunks with multicall, overlapped across threads.
+        # Bound-method and multiplier tables replace the per-user if/elif
+        # chains in both the fetch and valuation loops
         LP_CHUNK_SIZE = 500
-        lp_balances = {}
-
-        for chunk_idx in range(0, len(all_lp_users), LP_CHUNK_SIZE):
-            chunk = all_lp_users[chunk_idx:chunk_idx + LP_CHUNK_SIZE]
-            progress = (chunk_idx + len(chunk)) / len(all_lp_users) * 100
-            print(f"  [{progress:5.1f}%] Processing LP users {chunk_idx+1} to {chunk_idx+len(chunk)} of {len(all_lp_users)}")
+        balanceOf_by_source = {
+            'curve': curve_gauge.balanceOf,
+            'veyfi': veyfi_gauge.balanceOf,
+            'sd': sd_gauge.balanceOf,
+            'convex': reward.balanceOf,
+        }
+        multiplier_by_source = {
+            'curve': ycrv_per_lp,
+            'veyfi': ycrv_per_share,
+            'sd': ycrv_per_share,
+            'convex': ycrv_per_lp,
+        }
 
-            # Fetch balances for this chunk
+        def fetch_lp_balances(chunk):
+            chunk_balances = {}
             with multicall(block_identifier=SNAPSHOT_HEIGHT):
                 for source, user in chunk:
-                    if source == 'curve':
-                        lp_balances[(source, user)] = curve_gauge.balanceOf(user)
-                    elif source == 'veyfi':
-                        lp_balances[(source, user)] = veyfi_gauge.balanceOf(user)
-                    elif source == 'sd':
-                        lp_balances[(source, user)] = sd_gauge.balanceOf(user)
-                    elif source == 'convex':
-                        lp_balances[(source, user)] = reward.balanceOf(user)
+                    chunk_balances[(source, user)] = balanceOf_by_source[source](user)
+            return chunk_balances
+
+        lp_balances = fetch_chunks_parallel(all_lp_users, LP_CHUNK_SIZE, fetch_lp_balances, 'LP balances')
 
         # Process all results
         for (source, user), balance in lp_balances.items():
-            if source == 'curve':
-                value = balance * ycrv_per_lp
-            elif source in ['veyfi', 'sd']:
-                value = balance * ycrv_per_share
-            elif source == 'convex':
-                value = balance * ycrv_per_lp
-
+            value = balance * multiplier_by_source[source]
             if value > 0:
                 print(f'{source} user', user, value/1e18)
                 values[user] = values.get(user, 0) + value
@@ -399,24 +557,47 @@ def ycrv_positions():
     account_list = list(values.keys())  # Create list AFTER partner wallets added
 
     print(f"Processing Summer proxy ownership for {len(account_list)} accounts in chunks...")
-    proxies_consolidated = 0
-    for chunk_idx in range(0, len(account_list), CHUNK_SIZE):
-        chunk = account_list[chunk_idx:chunk_idx + CHUNK_SIZE]
 
-        # Fetch all owners for this chunk
-        owners = {}
+    # Short-circuit before any RPC: cached ownership results are reused, and
+    # accounts known to be EOAs can't be Summer proxies (proxies are
+    # contracts), so they resolve to the zero address for free
+    cached_owners = load_owners(guard.address)
+    eoas = known_eoas()
+    owners = {}
+    to_query = []
+    for account in account_list:
+        cached = cached_owners.get(account.lower())
+        if cached is not None:
+            owners[account] = cached
+        elif account.lower() in eoas:
+            owners[account] = ZERO_ADDRESS
+        else:
+            to_query.append(account)
+    print(f"  {len(account_list) - len(to_query)} accounts resolved from cache/EOA set, querying {len(to_query)}")
+
+    def fetch_owners(chunk):
+        chunk_owners = {}
         with multicall(block_identifier=SNAPSHOT_HEIGHT):
             for account in chunk:
-                owners[account] = guard.owners(account)
-
-        # Process results
-        for account in chunk:
-            owner = owners[account]
-            if owner != ZERO_ADDRESS:
-                value = values.get(account, 0)
-                values[owner] = values.get(owner, 0) + value
-                values.pop(account, None)  # Remove proxy after transferring to owner
-                proxies_consolidated += 1
+                chunk_owners[account] = guard.owners(account)
+        return chunk_owners
+
+    if to_query:
+        new_owners = fetch_chunks_parallel(to_query, CHUNK_SIZE, fetch_owners, 'Summer owners')
+        update_owners(guard.address, new_owners)
+        owners.update(new_owners)
+
+    # Process results: rebuild into a fresh Counter instead of deleting from
+    # the live dict mid-pass — proxy balances roll up to their owner entry
+    proxies_consolidated = 0
+    new_values = Counter()
+    for account, v in values.items():
+        owner = owners.get(account, ZERO_ADDRESS)
+        if owner != ZERO_ADDRESS:
+            proxies_consolidated += 1
+        target = owner if owner != ZERO_ADDRESS else account
+        new_values[target] += v
+    values = dict(new_values)
     print(f"Consolidated {proxies_consolidated} Summer proxy accounts")
 
     FOUR_A = '0x4444AAAACDBa5580282365e25b16309Bd770ce4a'
@@ -433,14 +614,15 @@ def ycrv_positions():
 
         # Any more users that need a remapping?
     }
-    remappings_applied = 0
-    for user, value in list(values.items()):
-        if user in remappings:
-            del values[user]
-            target = remappings[user]
-            values[target] = values.get(target, 0) + value
-            remappings_applied += 1
-    print(f"Applied {remappings_applied} remappings")
+    # Single pass: collect remapped balances into a Counter, then apply the
+    # deletions and merged credits without re-hashing each user three times
+    delta = Counter()
+    remapped_users = [user for user in values if user in remappings]
+    for user in remapped_users:
+        delta[remappings[user]] += values.pop(user)
+    for target, value in delta.items():
+        values[target] = values.get(target, 0) + value
+    print(f"Applied {len(remapped_users)} remappings")
 
     # Remove Ignore List
     REMOVAL_LIST = [
@@ -455,39 +637,60 @@ def ycrv_positions():
         YCRV['YBS_STRATEGY'],
         ZERO_ADDRESS,
     ]
-    for item in REMOVAL_LIST:
-        values.pop(item, None)
+    for item in set(REMOVAL_LIST) & values.keys():
+        del values[item]
 
-    # Batch all withdrawalQueue calls with multicall
+    # The withdrawal queue is a zero-terminated array and the vault exposes no
+    # length getter, so read it in aggregated multicall batches and stop at
+    # the first terminator — typically one round trip covering the live
+    # prefix instead of all 100 slots
     print("Fetching withdrawal queue strategies...")
-    strategies = {}
-    with multicall(block_identifier=SNAPSHOT_HEIGHT):
-        for i in range(0, 100):
-            strategies[i] = lp_ycrv_v2.withdrawalQueue(i)
+    MAX_QUEUE = 100
+    QUEUE_PROBE_BATCH = 16
+    strategies = []
+    for start in range(0, MAX_QUEUE, QUEUE_PROBE_BATCH):
+        with multicall(block_identifier=SNAPSHOT_HEIGHT):
+            batch = [
+                lp_ycrv_v2.withdrawalQueue(i)
+                for i in range(start, min(start + QUEUE_PROBE_BATCH, MAX_QUEUE))
+            ]
+        if ZERO_ADDRESS in batch:
+            strategies.extend(batch[:batch.index(ZERO_ADDRESS)])
+            break
+        strategies.extend(batch)
 
     # Remove strategies from values
-    for i, strat in strategies.items():
-        if strat == ZERO_ADDRESS:
-            break
+    for strat in strategies:
         values.pop(strat, None)
 
     if include_untokenized:
         # Handle untokenized
         total = sum(values.values())
         untokenized = (
-            ve.balanceOf(YCRV['YEARN_VOTER'], block_identifier=SNAPSHOT_HEIGHT) - 
+            block_cached_call(ve, 'balanceOf', YCRV['YEARN_VOTER'], block=SNAPSHOT_HEIGHT) -
             total
         )
         values[YCRV['YCHAD']] = values.get(YCRV['YCHAD'], 0) + untokenized # Yearn controls all untokenized amounts
 
-    values = dict(sorted(values.items(), key=lambda item: item[1], reverse=True))   # Sort list by highest value
-    values = {k: int(float(v)) for k, v in values.items()}                          # Convert to int
-    values = {k: v for k, v in values.items() if v >= MIN_AMOUNT}                   # Remove anything less than min
-
-    # Discover contracts (identify addresses with bytecode that aren't EOF format)
-    for user, val in list(values.items()):
-        data = web3.eth.get_code(user).hex()
-        if data == '0x' or data == '' or data.startswith(EOF_BYTECODE_PREFIX) or data.startswith(EOF_BYTECODE_PREFIX_NO_PREFIX):
+    # Vectorized MIN_AMOUNT cut and sort: amounts live in object-dtype numpy
+    # arrays (wei values overflow int64) so the filter is one masked compare
+    # and the dict is rebuilt once from the surviving entries
+    keys = np.array(list(values.keys()), dtype=object)
+    vals = np.fromiter((int(float(v)) for v in values.values()), dtype=object, count=len(values))
+    mask = vals >= MIN_AMOUNT
+    keys = keys[mask]
+    vals = vals[mask]
+    order = np.argsort(-vals, kind='stable')
+    values = {keys[i]: vals[i] for i in order}
+
+    # Discover contracts (identify addresses with bytecode that aren't EOF format).
+    # Code is immutable at a historical block, so prefixes come from the disk
+    # cache and only new addresses hit the RPC (fetched concurrently).
+    code_prefixes = get_code_prefixes(list(values.keys()))
+    eof_marker = EOF_BYTECODE_PREFIX_NO_PREFIX
+    for user, val in values.items():
+        prefix = code_prefixes[user]
+        if not prefix or prefix[:6] == eof_marker:
             continue
         print(user, val/1e18)
         contracts.append(user)
@@ -527,5 +730,11 @@ def ycrv_positions():
     # Write to json with block-specific filename
     os.makedirs(snapshot_dir, exist_ok=True)
     output_file = DropConfig.get_snapshot_file(SNAPSHOT_HEIGHT)
-    with open(output_file, 'w') as f:
-        dump(output, f, indent=2)
\ No newline at end of file
+    # orjson serializes the large recipient map far faster than stdlib json;
+    # the tiny config.json writes above stay on stdlib json
+    if orjson:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(output, f, indent=2)
\ No newline at end of file
@@ -10,10 +10,17 @@ Each drop's generate_merkle_data.py reads from its own config.json.
 import click
 import sys
 import os
+from functools import lru_cache
 from importlib import import_module
 from brownie import Contract
 
 
+@lru_cache(maxsize=None)
+def _load_drop_module(drop_dir, module_name):
+    """Import one of a drop's modules once per process."""
+    return import_module(f'scripts.drops.{drop_dir}.{module_name}')
+
+
 def main():
     """
     Entry point for brownie run.
@@ -30,11 +37,12 @@ def main():
         click.echo("Error: scripts/drops/ directory not found")
         sys.exit(1)
 
-    for entry in os.listdir(drops_dir):
-        entry_path = os.path.join(drops_dir, entry)
-        merkle_script = os.path.join(entry_path, 'generate_merkle_data.py')
-        if os.path.isdir(entry_path) and os.path.exists(merkle_script):
-            available_drops.append(entry)
+    # scandir caches the stat info per entry; sort for deterministic prompts
+    with os.scandir(drops_dir) as entries:
+        for entry in entries:
+            if entry.is_dir() and os.path.exists(os.path.join(entry.path, 'generate_merkle_data.py')):
+                available_drops.append(entry.name)
+    available_drops.sort()
 
     if not available_drops:
         click.echo("Error: No merkle generation scripts found in scripts/drops/ directory")
@@ -63,7 +71,7 @@ def main():
 
     # Load drop configuration to display and confirm
     try:
-        drop_module = import_module(f'scripts.drops.{drop_dir}.snapshot')
+        drop_module = _load_drop_module(drop_dir, 'snapshot')
         DropConfig = drop_module.DropConfig
         config = DropConfig.load_config()
 
@@ -146,7 +154,7 @@ def main():
     # Import and run merkle generation
     try:
         click.echo(f"\nImporting merkle generation for {drop_dir}...")
-        merkle_module = import_module(f'scripts.drops.{drop_dir}.generate_merkle_data')
+        merkle_module = _load_drop_module(drop_dir, 'generate_merkle_data')
 
         # Run merkle generation (reads config.json internally)
         click.echo("Starting merkle generation...\n")
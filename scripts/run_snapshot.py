@@ -11,9 +11,20 @@ import click
 import sys
 import os
 import json
+from functools import lru_cache
 from importlib import import_module
 from brownie import chain
 
+@lru_cache(maxsize=None)
+def _load_drop(drop_dir):
+    """
+    Import a drop's snapshot module once per process.
+
+    Module init re-binds brownie Contracts and is slow, so the second
+    lookup (after the interactive prompts) reuses the first import.
+    """
+    return import_module(f'scripts.drops.{drop_dir}.snapshot')
+
 def main():
     """
     Entry point for brownie run.
@@ -30,13 +41,16 @@ def main():
         click.echo("Error: scripts/drops/ directory not found")
         sys.exit(1)
 
-    for entry in os.listdir(drops_dir):
-        entry_path = os.path.join(drops_dir, entry)
-        snapshot_path = os.path.join(entry_path, 'snapshot.py')
-        config_path = os.path.join(entry_path, 'config.py')
-        # Accept drops with either snapshot.py or config.py (for backwards compatibility)
-        if os.path.isdir(entry_path) and (os.path.exists(snapshot_path) or os.path.exists(config_path)):
-            available_drops.append(entry)
+    # scandir caches the stat info per entry; sort for deterministic prompts
+    with os.scandir(drops_dir) as entries:
+        for entry in entries:
+            # Accept drops with either snapshot.py or config.py (for backwards compatibility)
+            if entry.is_dir() and (
+                os.path.exists(os.path.join(entry.path, 'snapshot.py'))
+                or os.path.exists(os.path.join(entry.path, 'config.py'))
+            ):
+                available_drops.append(entry.name)
+    available_drops.sort()
 
     if not available_drops:
         click.echo("Error: No drop configurations found in scripts/drops/ directory")
@@ -65,7 +79,7 @@ def main():
 
     # Import drop configuration (try snapshot module first for flexibility)
     try:
-        snapshot_module = import_module(f'scripts.drops.{drop_dir}.snapshot')
+        snapshot_module = _load_drop(drop_dir)
         if hasattr(snapshot_module, 'DropConfig'):
             DropConfig = snapshot_module.DropConfig
         else:
@@ -212,7 +226,7 @@ def main():
 
     # Import and run snapshot
     try:
-        snapshot_module = import_module(f'scripts.drops.{drop_dir}.snapshot')
+        snapshot_module = _load_drop(drop_dir)
 
         # Run snapshot (reads config.json internally)
         click.echo("Starting snapshot...")
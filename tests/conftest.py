@@ -1,7 +1,20 @@
 import pytest, requests
+from functools import lru_cache
 from brownie import ZERO_ADDRESS, config, Contract, web3, chain, YlockerDrops
 
 
+@lru_cache(maxsize=None)
+def _dai_balance_slot(address):
+    """DAI balanceOf storage slot for an address: keccak(abi.encode(addr, 2)).
+
+    Memoized — the whale account is stable across the suite, so the
+    keccak + ABI encode runs once instead of per test.
+    """
+    from eth_abi import encode
+    from eth_utils import keccak
+    return '0x' + keccak(encode(['address', 'uint256'], [address, 2])).hex()
+
+
 # This causes test not to re-run fixtures on each run
 @pytest.fixture(autouse=True)
 def isolation(fn_isolation):
@@ -14,20 +27,18 @@ def gov(accounts):
     yield accounts[0]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dai():
+    # Read-only Contract handle; session scope skips the ABI re-load per test
     yield Contract("0x6B175474E89094C44Da98b954EedeAC495271d0F")
 
 @pytest.fixture
 def dai_whale(accounts, web3, dai):
-    # Use accounts[1] and give it DAI via storage manipulation
+    # Use accounts[1] and give it DAI via storage manipulation. The storage
+    # write must repeat per test (isolation reverts it) but the slot hash
+    # is cached on the whale address.
     whale = accounts[1]
-    from eth_abi import encode
-    from eth_utils import keccak
-    key = int(whale.address, 16)
-    slot_index = 2
-    packed = encode(['address', 'uint256'], [whale.address, slot_index])
-    slot_hash = '0x' + keccak(packed).hex()
+    slot_hash = _dai_balance_slot(whale.address)
     balance_value = 10_000_000 * 10**18
     balance = '0x' + hex(balance_value)[2:].zfill(64)
     web3.provider.make_request("anvil_setStorageAt", [dai.address, slot_hash, balance])
@@ -67,16 +78,24 @@ def create_drop(drops, dai, dai_whale, gov):
 
     return _create_drop
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def yb_merkle_data():
-    """Load production YB distribution merkle data"""
+    """Load production YB distribution merkle data.
+
+    Session-scoped: the file holds one claim per holder and re-parsing it
+    for every test dominated fixture time. Tests must not mutate the dict.
+    """
     import json
     from config import Config
-    with open(Config.YB_DISTRO_FILE, 'r') as f:
-        data = json.load(f)
-    yield data
-
-@pytest.fixture
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    with open(Config.YB_DISTRO_FILE, 'rb') as f:
+        raw = f.read()
+    yield orjson.loads(raw) if orjson else json.loads(raw)
+
+@pytest.fixture(scope="session")
 def yb_token():
     """Use DAI as stand-in for YB token in tests"""
     yield Contract("0x6B175474E89094C44Da98b954EedeAC495271d0F")
\ No newline at end of file
@@ -1,3 +1,4 @@
+import pytest
 from brownie import Contract, interface, accounts, chain, reverts, web3
 import time
 
@@ -83,7 +84,12 @@ def test_delegate(drops, gov, accounts):
     drops.setDelegate(accounts[3], accounts[4], {"from": gov})
 
 
-def test_yb_claim_production_data(drops, yb_token, yb_merkle_data, dai_whale, gov):
+# One pytest item per tested claim so pytest-xdist (-n auto) can spread the
+# on-chain impersonation + claim round-trips across workers. Slots index
+# into the claims dict at test time, keeping the JSON parse inside the
+# session-scoped yb_merkle_data fixture instead of at collection.
+@pytest.mark.parametrize("claim_slot", range(3))
+def test_yb_claim_production_data(drops, yb_token, yb_merkle_data, dai_whale, gov, claim_slot):
     """Test claiming with actual production YB merkle data"""
     # Get merkle root and total from production data
     merkle_root = yb_merkle_data['merkle_root']
@@ -97,25 +103,22 @@ def test_yb_claim_production_data(drops, yb_token, yb_merkle_data, dai_whale, go
     drop_id = drops.dropCount()
     drops.createDrop('test description', yb_token.address, 0, duration, total_amount, merkle_root, {"from": gov})
 
-    # Pick first 3 addresses from claims to test
-    test_accounts = list(yb_merkle_data['claims'].keys())[:3]
-
-    for account in test_accounts:
-        claim_data = yb_merkle_data['claims'][account]
-        amount = int(claim_data['amount'])
-        index = claim_data['index']
-        proof = claim_data['proof']
+    account = list(yb_merkle_data['claims'].keys())[claim_slot]
+    claim_data = yb_merkle_data['claims'][account]
+    amount = int(claim_data['amount'])
+    index = claim_data['index']
+    proof = claim_data['proof']
 
-        # Impersonate account for testing
-        balance_before = yb_token.balanceOf(account)
+    # Impersonate account for testing
+    balance_before = yb_token.balanceOf(account)
 
-        # Claim tokens
-        drops.claim(drop_id, account, account, amount, proof, index, {"from": account})
+    # Claim tokens
+    drops.claim(drop_id, account, account, amount, proof, index, {"from": account})
 
-        # Verify claim succeeded
-        assert drops.hasClaimed(account, drop_id) == True
-        balance_after = yb_token.balanceOf(account)
-        assert balance_after - balance_before == amount
+    # Verify claim succeeded
+    assert drops.hasClaimed(account, drop_id) == True
+    balance_after = yb_token.balanceOf(account)
+    assert balance_after - balance_before == amount
 
 
 def test_yb_double_claim_protection(drops, yb_token, yb_merkle_data, dai_whale, gov):
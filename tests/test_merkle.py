@@ -0,0 +1,29 @@
+import random
+
+import pytest
+
+from utils import merkle
+from utils.merkle import MerkleTree
+
+
+@pytest.mark.parametrize("num_leaves", [19, 33, 2051, 5125])
+def test_parallel_layer_build_matches_legacy(monkeypatch, num_leaves):
+    """Packed parallel layer builder must equal the legacy per-pair path.
+
+    Regression: odd-sized layers above the parallel threshold leaked the
+    promoted tail node into the last worker chunk, silently corrupting the
+    root and every proof (first seen at 2051 leaves with 8 workers).
+    """
+    # Force the pool path regardless of machine size or leaf count
+    monkeypatch.setattr(merkle, "PARALLEL_MIN_PAIRS", 8)
+    monkeypatch.setattr(merkle.os, "cpu_count", lambda: 8)
+
+    rng = random.Random(num_leaves)
+    leaves = sorted({bytes(rng.getrandbits(8) for _ in range(32)) for _ in range(num_leaves)})
+
+    layers = merkle._build_layers(leaves)
+    legacy = MerkleTree.get_layers(list(leaves))
+
+    assert len(layers) == len(legacy)
+    for packed, reference in zip(layers, legacy):
+        assert bytes(packed) == b"".join(reference)
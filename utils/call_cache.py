@@ -0,0 +1,57 @@
+"""
+Persistent cache for single-point contract reads at pinned blocks.
+
+Values like pricePerShare or a balance at a historical block never change, but
+parameter sweeps over the same SNAPSHOT_HEIGHT (toggling include_lp,
+include_untokenized, ...) re-hit the node for each of them on every run.
+Results are keyed by contract, method, args and block and stored as ints.
+"""
+import json
+from pathlib import Path
+from threading import Lock
+
+CACHE_DIR = Path(__file__).parent.parent / "data" / "cache"
+CALL_CACHE_FILE = CACHE_DIR / "call_cache.json"
+
+_lock = Lock()
+
+
+def _load() -> dict:
+    if not CALL_CACHE_FILE.exists():
+        return {}
+
+    with open(CALL_CACHE_FILE, 'r') as f:
+        return json.load(f).get("calls", {})
+
+
+def block_cached_call(contract, method_name, *args, block):
+    """
+    Call a view method at a pinned block, serving repeats from disk.
+
+    Args:
+        contract: Brownie contract to call
+        method_name: Name of the view method (must return an int)
+        *args: Positional call arguments
+        block: Block height to pin the call to
+
+    Returns:
+        The int result of the call
+    """
+    arg_str = ','.join(str(a) for a in args)
+    key = f"{contract.address.lower()}.{method_name}({arg_str})@{block}"
+
+    with _lock:
+        cache = _load()
+        if key in cache:
+            return int(cache[key])
+
+    result = int(getattr(contract, method_name)(*args, block_identifier=block))
+
+    with _lock:
+        cache = _load()
+        cache[key] = result
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(CALL_CACHE_FILE, 'w') as f:
+            json.dump({"version": "1.0", "calls": cache}, f, indent=2)
+
+    return result
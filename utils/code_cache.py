@@ -0,0 +1,108 @@
+"""
+Persistent cache for eth_getCode contract-discovery lookups.
+
+Deployed bytecode is immutable for historical queries, so repeated snapshot
+runs can answer "is this address a contract?" from disk instead of issuing
+hundreds of serial eth_getCode round trips.
+
+Only a short code prefix is stored per address (enough to distinguish EOAs,
+EOF-format accounts and regular contracts) to keep the cache file small.
+
+Entries with an empty prefix double as a persistent negative cache of known
+EOAs: an EOA can only gain code forward in time, so for historical-block
+queries a cached empty result stays valid across snapshots and the lookup
+can be skipped outright (see known_eoas()).
+"""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable
+
+from brownie import web3
+
+CACHE_DIR = Path(__file__).parent.parent / "data" / "cache"
+CODE_CACHE_FILE = CACHE_DIR / "code_cache.json"
+
+# Bytes of code prefix retained per address — covers the 3-byte EOF marker
+CODE_PREFIX_BYTES = 4
+
+GET_CODE_MAX_WORKERS = 8  # Concurrent eth_getCode calls for uncached addresses
+
+_save_lock = Lock()
+
+
+def load_cache() -> Dict[str, str]:
+    """
+    Load the code-prefix cache from disk.
+
+    Returns:
+        Dict mapping lowercase address -> code prefix hex ('' for EOAs)
+    """
+    if not CODE_CACHE_FILE.exists():
+        return {}
+
+    with open(CODE_CACHE_FILE, 'r') as f:
+        return json.load(f).get("codes", {})
+
+
+def save_cache(codes: Dict[str, str]) -> None:
+    """
+    Save the code-prefix cache to disk.
+
+    Args:
+        codes: Dict mapping lowercase address -> code prefix hex
+    """
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with _save_lock:
+        with open(CODE_CACHE_FILE, 'w') as f:
+            json.dump({"version": "1.0", "codes": codes}, f, indent=2)
+
+
+def _fetch_code_prefix(address: str) -> str:
+    """Fetch the code prefix for one address via RPC."""
+    code = bytes(web3.eth.get_code(address))
+    return code[:CODE_PREFIX_BYTES].hex()
+
+
+def get_code_prefixes(addresses: Iterable[str]) -> Dict[str, str]:
+    """
+    Resolve code prefixes for many addresses, cache-first.
+
+    Cached addresses are served from disk; the residual set is fetched
+    concurrently and the cache is rewritten once at the end.
+
+    Args:
+        addresses: Addresses to classify
+
+    Returns:
+        Dict mapping each input address -> code prefix hex ('' for EOAs)
+    """
+    addresses = list(addresses)
+    cache = load_cache()
+
+    results = {}
+    uncached = []
+    for addr in addresses:
+        prefix = cache.get(addr.lower())
+        if prefix is not None:
+            results[addr] = prefix
+        else:
+            uncached.append(addr)
+
+    if uncached:
+        print(f"  [CODE CACHE] {len(addresses) - len(uncached)} cached, fetching {len(uncached)} addresses...")
+        with ThreadPoolExecutor(max_workers=GET_CODE_MAX_WORKERS) as executor:
+            for addr, prefix in zip(uncached, executor.map(_fetch_code_prefix, uncached)):
+                results[addr] = prefix
+                cache[addr.lower()] = prefix
+        save_cache(cache)
+    else:
+        print(f"  [CODE CACHE] All {len(addresses)} addresses served from cache")
+
+    return results
+
+
+def known_eoas() -> set:
+    """Return the set of cached addresses known to have no code."""
+    return {addr for addr, prefix in load_cache().items() if prefix == ''}
@@ -1,5 +1,24 @@
+import time
 from brownie import web3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+
+# Number of speculative eth_getCode probes issued per search round
+CREATION_SEARCH_PROBES = 8
+
+# Number of block-header probes fetched per timestamp-search round
+TIMESTAMP_SEARCH_PROBES = 4
+
+# Concurrent eth_getLogs requests; keep within provider rate limits
+GET_LOGS_MAX_WORKERS = 16
+
+# Blocks within this distance of the head bypass the timestamp cache
+# (reorg safety); beyond it timestamps are immutable
+REORG_SAFETY_BLOCKS = 64
+
+# How long a fetched head height is trusted for the cache-eligibility check
+HEAD_TTL_SECONDS = 15
 
 
 def block_to_date(b):
@@ -16,25 +35,77 @@ def closest_block_before_timestamp(timestamp: int) -> int:
 
 
 def _closest_block_after_timestamp(timestamp: int) -> int:
-    height = web3.eth.block_number
-    lo, hi = 0, height
-
-    while hi - lo > 1:
-        mid = lo + (hi - lo) // 2
-        if get_block_timestamp(mid) > timestamp:
-            hi = mid
-        else:
-            lo = mid
+    lo, hi = 0, web3.eth.block_number
+    lo_ts = get_block_timestamp(lo)
+    hi_ts = get_block_timestamp(hi)
 
-    if get_block_timestamp(hi) < timestamp:
+    if hi_ts < timestamp:
         raise Exception("timestamp is in the future")
+
+    # Interpolation search: estimate the target from the average block time
+    # of the current window instead of bisecting. Each round also fetches a
+    # few evenly-spaced fallback probes in the same concurrent round-trip,
+    # so irregular block times still shrink the window by ~probe-count x.
+    while hi - lo > 1:
+        span = hi - lo
+        avg_block_time = (hi_ts - lo_ts) / span
+        est = lo + int((timestamp - lo_ts) / avg_block_time)
+        k = min(TIMESTAMP_SEARCH_PROBES - 1, span - 1)
+        probes = {min(max(est, lo + 1), hi - 1)}
+        probes.update(lo + span * (i + 1) // (k + 1) for i in range(k))
+        probes = sorted(p for p in probes if lo < p < hi)
+        ts_map = get_block_timestamps(probes)
+        for p in probes:
+            if ts_map[p] > timestamp:
+                hi, hi_ts = p, ts_map[p]
+                break
+            lo, lo_ts = p, ts_map[p]
     return hi
 
 
+_head_cache = {'height': 0, 'fetched': 0.0}
+
+
+def _chain_head():
+    """Head height, refreshed at most every HEAD_TTL_SECONDS."""
+    now = time.monotonic()
+    if now - _head_cache['fetched'] > HEAD_TTL_SECONDS:
+        _head_cache['height'] = web3.eth.block_number
+        _head_cache['fetched'] = now
+    return _head_cache['height']
+
+
+@lru_cache(maxsize=8192)
+def _finalized_block_timestamp(height):
+    return web3.eth.get_block(height)['timestamp']
+
+
 def get_block_timestamp(height):
+    # Finalized timestamps never change, so repeat searches in one process
+    # (multiple snapshots, before/after lookups) skip the RPC entirely;
+    # blocks near the tip stay uncached in case of reorgs
+    if height <= _chain_head() - REORG_SAFETY_BLOCKS:
+        return _finalized_block_timestamp(height)
     return web3.eth.get_block(height)['timestamp']
 
 
+def get_block_timestamps(heights):
+    """
+    Fetch timestamps for several blocks in one concurrent round-trip.
+
+    Args:
+        heights: Block numbers to fetch
+
+    Returns:
+        Dict mapping block number -> timestamp
+    """
+    heights = list(heights)
+    if len(heights) == 1:
+        return {heights[0]: get_block_timestamp(heights[0])}
+    with ThreadPoolExecutor(max_workers=len(heights)) as executor:
+        return dict(zip(heights, executor.map(get_block_timestamp, heights)))
+
+
 def timestamp_to_date_string(ts):
     return datetime.utcfromtimestamp(ts).strftime("%m/%d/%Y, %H:%M:%S")
 
@@ -46,19 +117,31 @@ def timestamp_to_string(ts):
 
 def contract_creation_block(address):
     """
-    Find contract creation block using binary search.
+    Find contract creation block using a parallel k-ary search.
+
+    Each round probes several evenly-spaced blocks of the current window
+    concurrently, so the window shrinks by ~(k+1)x per network round-trip
+    instead of 2x — the search is latency-bound, not CPU-bound.
     NOTE Requires access to historical state. Doesn't account for CREATE2 or SELFDESTRUCT.
     """
     lo = 0
     hi = end = web3.eth.block_number
 
-    while hi - lo > 1:
-        mid = lo + (hi - lo) // 2
-        code = web3.eth.get_code(address, block_identifier=mid)
-        if code:
-            hi = mid
-        else:
-            lo = mid
+    def _has_code(block):
+        return bool(web3.eth.get_code(address, block_identifier=block))
+
+    with ThreadPoolExecutor(max_workers=CREATION_SEARCH_PROBES) as executor:
+        while hi - lo > 1:
+            span = hi - lo
+            k = min(CREATION_SEARCH_PROBES, span - 1)
+            probes = sorted({lo + span * (i + 1) // (k + 1) for i in range(k)})
+            # lo rises to the highest probe without code, hi drops to the
+            # lowest probe with code — the creation block stays in (lo, hi]
+            for block, has_code in zip(probes, executor.map(_has_code, probes)):
+                if has_code:
+                    hi = block
+                    break
+                lo = block
     return hi if hi != end else None
 
 
@@ -73,9 +156,17 @@ def get_logs_chunked(contract, event_name, start_block=0, end_block=0, chunk_siz
     if end_block == 0:
         end_block = web3.eth.block_number
 
+    # Chunks are independent eth_getLogs calls bound on network latency, so
+    # fetch them concurrently and concatenate in block order
+    ranges = [
+        (start, min(end_block, start + chunk_size))
+        for start in range(start_block, end_block, chunk_size)
+    ]
     logs = []
-    while start_block < end_block:
-        logs += event.get_logs(fromBlock=start_block, toBlock=min(end_block, start_block + chunk_size))
-        start_block += chunk_size
+    if not ranges:
+        return logs
+    with ThreadPoolExecutor(max_workers=min(GET_LOGS_MAX_WORKERS, len(ranges))) as executor:
+        for chunk_logs in executor.map(lambda r: event.get_logs(fromBlock=r[0], toBlock=r[1]), ranges):
+            logs += chunk_logs
 
     return logs
\ No newline at end of file
@@ -6,37 +6,118 @@ the entire blockchain history on every run.
 """
 import json
 import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from threading import Lock
 from typing import Set, Tuple, Optional, Dict, Any
 
+from eth_utils import to_checksum_address
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # Cache is stored uncompressed without zstandard
+
 CACHE_DIR = Path(__file__).parent.parent / "data" / "cache"
-CACHE_FILE = CACHE_DIR / "event_cache.json"
+CACHE_FILE = CACHE_DIR / "event_cache.pkl"
+
+# Pre-binary-format cache; migrated on first load and then ignored
+LEGACY_CACHE_FILE = CACHE_DIR / "event_cache.json"
+
+# zstd frame header, used to detect whether a cache file was compressed
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Concurrent eth_getLogs requests per scan; keep within provider rate limits
+SCAN_MAX_WORKERS = 16
+
+# How many chunks to process between progress checkpoints to the cache file
+CACHE_WRITE_INTERVAL_CHUNKS = 10
+
+# How many chunks between progress lines; per-chunk printing is hundreds of
+# write syscalls on a long scan
+PROGRESS_PRINT_INTERVAL_CHUNKS = 10
+
+# Serializes read-modify-write cycles on the cache file so independent
+# scans can run concurrently from the snapshot scripts
+_cache_lock = Lock()
+
+
+def _pack_address(addr) -> bytes:
+    """Pack a hex address into its 20-byte binary form (idempotent)."""
+    return bytes.fromhex(addr[2:]) if isinstance(addr, str) else bytes(addr)
+
+
+# Memoized — the same holders show up across scans, and to_checksum_address
+# runs a keccak per call
+_unpack_address = lru_cache(maxsize=None)(to_checksum_address)
 
 
 def load_cache() -> Dict[str, Any]:
     """
     Load the event cache from disk.
 
+    The cache is stored as a pickle (zstd-compressed when zstandard is
+    installed) — addresses pack to 20 bytes instead of 42-char hex strings
+    and load/save skip JSON encode/decode entirely. A legacy JSON cache is
+    migrated transparently on first load.
+
     Returns:
         Dict with cache data, or empty structure if file doesn't exist
     """
-    if not CACHE_FILE.exists():
-        return {"version": "1.0", "caches": {}}
-
-    with open(CACHE_FILE, 'r') as f:
-        return json.load(f)
+    if CACHE_FILE.exists():
+        with open(CACHE_FILE, 'rb') as f:
+            raw = f.read()
+        if raw[:4] == _ZSTD_MAGIC:
+            if zstandard is None:
+                raise RuntimeError(
+                    f"{CACHE_FILE} is zstd-compressed but zstandard is not installed"
+                )
+            raw = zstandard.ZstdDecompressor().decompress(raw)
+        return pickle.loads(raw)
+
+    if LEGACY_CACHE_FILE.exists():
+        with open(LEGACY_CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+        for entry in cache.get("caches", {}).values():
+            entry["users"] = sorted(_pack_address(u) for u in entry["users"])
+        return cache
+
+    return {"version": "1.0", "caches": {}}
 
 
 def save_cache(cache_data: Dict[str, Any]) -> None:
     """
     Save the event cache to disk.
 
+    Writes to a temp file and renames it into place, so a crash mid-write
+    leaves the previous cache intact instead of a truncated file.
+
     Args:
         cache_data: Complete cache dictionary to save
     """
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    with open(CACHE_FILE, 'w') as f:
-        json.dump(cache_data, f, indent=2)
+    payload = pickle.dumps(cache_data, protocol=5)
+    if zstandard:
+        payload = zstandard.ZstdCompressor(level=3).compress(payload)
+    tmp_file = CACHE_FILE.with_name(CACHE_FILE.name + '.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_file, CACHE_FILE)
+
+
+# The cache is loaded from disk once per process and mutated in memory;
+# loading+re-serializing the full JSON per update made scan I/O quadratic
+# in cached state. Access only under _cache_lock via _get_cache().
+_cache_data: Optional[Dict[str, Any]] = None
+
+
+def _get_cache() -> Dict[str, Any]:
+    global _cache_data
+    if _cache_data is None:
+        _cache_data = load_cache()
+    return _cache_data
 
 
 def get_cache_key(contract_address: str, event_name: str) -> str:
@@ -64,11 +145,17 @@ def get_cached_entry(contract_address: str, event_name: str) -> Optional[Dict[st
         event_name: Event name
 
     Returns:
-        Cache entry dict or None if not found
+        Cache entry dict or None if not found. Users come back as
+        checksummed hex strings regardless of the packed storage form.
     """
-    cache = load_cache()
     key = get_cache_key(contract_address, event_name)
-    return cache.get("caches", {}).get(key)
+    with _cache_lock:
+        entry = _get_cache().get("caches", {}).get(key)
+    if entry is None:
+        return None
+    entry = dict(entry)
+    entry["users"] = [_unpack_address(u) for u in entry["users"]]
+    return entry
 
 
 def update_cache_entry(
@@ -90,7 +177,26 @@ def update_cache_entry(
         contract_name: Human-readable name (optional)
         deploy_block: Deployment block (optional, for reference)
     """
-    cache = load_cache()
+    with _cache_lock:
+        cache = _get_cache()
+        _set_cache_entry(cache, contract_address, event_name, users,
+                         last_scanned_block, contract_name, deploy_block)
+        save_cache(cache)
+
+
+def _set_cache_entry(
+    cache: Dict[str, Any],
+    contract_address: str,
+    event_name: str,
+    users: Set[str],
+    last_scanned_block: int,
+    contract_name: Optional[str] = None,
+    deploy_block: Optional[int] = None
+) -> None:
+    """Write an entry into an in-memory cache dict without touching disk.
+
+    Callers hold _cache_lock and decide when to flush via save_cache().
+    """
     key = get_cache_key(contract_address, event_name)
 
     cache["caches"][key] = {
@@ -99,11 +205,9 @@ def update_cache_entry(
         "event_name": event_name,
         "deploy_block": deploy_block,
         "last_scanned_block": last_scanned_block,
-        "users": sorted(list(users))  # Sort for consistency
+        "users": sorted(_pack_address(u) for u in users)  # Sort for consistency
     }
 
-    save_cache(cache)
-
 
 def scan_events_with_cache(
     contract: Any,
@@ -133,8 +237,12 @@ def scan_events_with_cache(
     """
     contract_address = contract.address
 
-    # Load cache entry if it exists
-    cached_entry = get_cached_entry(contract_address, event_name)
+    # Load cache entry if it exists. Users stay in packed 20-byte form for
+    # the whole scan — a bytes key hashes faster and costs less than half
+    # the memory of a 42-char string — and unpack only at the return.
+    key = get_cache_key(contract_address, event_name)
+    with _cache_lock:
+        cached_entry = _get_cache().get("caches", {}).get(key)
 
     if cached_entry:
         last_scanned = cached_entry["last_scanned_block"]
@@ -146,7 +254,7 @@ def scan_events_with_cache(
                   f"Using cached data (snapshot {snapshot_height} <= last_scanned {last_scanned})")
             # Return cached users, but we can't return cached logs (not stored)
             # So we return empty logs - caller must handle this
-            return cached_users, []
+            return {_unpack_address(u) for u in cached_users}, []
 
         # Scan only new blocks since last scan
         start_block = last_scanned + 1
@@ -160,6 +268,11 @@ def scan_events_with_cache(
         print(f"  [NO CACHE] {contract_name or contract_address}/{event_name}: "
               f"Scanning blocks {start_block} to {snapshot_height}")
 
+    # Nothing to scan (e.g. the snapshot predates deployment) — don't spin
+    # up an executor or rewrite the cache for an empty range
+    if start_block > snapshot_height:
+        return {_unpack_address(u) for u in cached_users}, []
+
     # Get the event object using Brownie's API
     # Brownie events are accessed via: contract.events.EventName().getLogs()
     try:
@@ -173,47 +286,63 @@ def scan_events_with_cache(
     total_blocks = snapshot_height - start_block + 1
     num_chunks = (total_blocks + chunk_size - 1) // chunk_size  # Ceiling division
 
-    all_logs = []
-    new_users = set()
-
-    for i in range(num_chunks):
-        chunk_start = start_block + (i * chunk_size)
-        chunk_end = min(chunk_start + chunk_size - 1, snapshot_height)
+    chunk_ranges = [
+        (start_block + (i * chunk_size),
+         min(start_block + (i * chunk_size) + chunk_size - 1, snapshot_height))
+        for i in range(num_chunks)
+    ]
 
-        # Progress indicator
-        progress = (i + 1) / num_chunks * 100
-        print(f"  [{progress:5.1f}%] Scanning blocks {chunk_start:,} to {chunk_end:,} "
-              f"(chunk {i+1}/{num_chunks})")
-
-        # Scan this chunk
+    def _fetch_chunk(chunk_range):
+        chunk_start, chunk_end = chunk_range
         if search_topics:
-            chunk_logs = event.get_logs(
+            return event.get_logs(
                 fromBlock=chunk_start,
                 toBlock=chunk_end,
                 argument_filters=search_topics
             )
-        else:
-            chunk_logs = event.get_logs(fromBlock=chunk_start, toBlock=chunk_end)
-
-        all_logs.extend(chunk_logs)
-
-        # Extract users from this chunk
-        chunk_users = extract_users_from_logs(chunk_logs, event_name)
-        new_users.update(chunk_users)
-
-        print(f"           Found {len(chunk_logs)} events, {len(chunk_users)} unique addresses in this chunk")
-
-        # Save progress after each chunk (in case of failure later)
-        if i < num_chunks - 1:  # Don't save intermediate progress on last chunk
-            temp_users = cached_users | new_users
-            update_cache_entry(
-                contract_address,
-                event_name,
-                temp_users,
-                chunk_end,  # Save up to this block
-                contract_name,
-                deploy_block
-            )
+        return event.get_logs(fromBlock=chunk_start, toBlock=chunk_end)
+
+    all_logs = []
+    new_users = set()
+
+    # Chunks are independent eth_getLogs calls, so fetch them concurrently.
+    # executor.map yields results in submit order, so the checkpointed block
+    # below only ever advances over a contiguous run of completed chunks.
+    with ThreadPoolExecutor(max_workers=min(SCAN_MAX_WORKERS, num_chunks)) as executor:
+        for i, chunk_logs in enumerate(executor.map(_fetch_chunk, chunk_ranges)):
+            chunk_start, chunk_end = chunk_ranges[i]
+
+            all_logs.extend(chunk_logs)
+
+            # Extract users from this chunk
+            chunk_users = extract_users_from_logs(chunk_logs, event_name)
+            new_users.update(chunk_users)
+
+            # Progress indicator, rate-limited — one line per chunk floods
+            # the terminal on multi-year scans
+            if (i + 1) % PROGRESS_PRINT_INTERVAL_CHUNKS == 0 or i == num_chunks - 1:
+                progress = (i + 1) / num_chunks * 100
+                print(f"  [{progress:5.1f}%] Scanned through block {chunk_end:,} "
+                      f"(chunk {i+1}/{num_chunks}): {len(all_logs)} events, "
+                      f"{len(new_users)} unique addresses so far")
+
+            # Record progress in memory after every chunk (in case of failure
+            # later), but only flush to disk every few chunks — each flush
+            # re-serializes the whole cache file
+            if i < num_chunks - 1:
+                with _cache_lock:
+                    cache = _get_cache()
+                    _set_cache_entry(
+                        cache,
+                        contract_address,
+                        event_name,
+                        cached_users | new_users,
+                        chunk_end,  # Save up to this block
+                        contract_name,
+                        deploy_block
+                    )
+                    if (i + 1) % CACHE_WRITE_INTERVAL_CHUNKS == 0:
+                        save_cache(cache)
 
     # Merge with cached users
     all_users = cached_users | new_users
@@ -231,10 +360,27 @@ def scan_events_with_cache(
     print(f"  [COMPLETE] {contract_name or contract_address}/{event_name}: "
           f"{len(new_users)} new users, {len(all_users)} total users")
 
-    return all_users, all_logs
+    return {_unpack_address(u) for u in all_users}, all_logs
 
 
-def extract_users_from_logs(logs: list, event_name: str) -> Set[str]:
+# Per-event field-name candidates; each inner tuple is one address slot and
+# the first present field wins (e.g. Transfer senders appear as 'sender',
+# 'from' or '_from' depending on the token's ABI vintage)
+_EVENT_USER_FIELDS = {
+    "Transfer": (('sender', 'from', '_from'), ('receiver', 'to', '_to')),
+    "Staked": (('account',),),
+    "CreateEscrow": (('user',), ('escrow',)),
+    "Deposited": (('user',),),
+}
+
+# Generic fallback: every common field is its own slot, so all that are
+# present get collected
+_GENERIC_USER_FIELDS = tuple(
+    (f,) for f in ('sender', 'receiver', 'from', 'to', 'account', 'user', 'address', '_from', '_to')
+)
+
+
+def extract_users_from_logs(logs: list, event_name: str) -> Set[bytes]:
     """
     Extract unique user addresses from event logs.
 
@@ -243,63 +389,44 @@ def extract_users_from_logs(logs: list, event_name: str) -> Set[str]:
         event_name: Type of event (determines which fields to extract)
 
     Returns:
-        Set of unique addresses
+        Set of unique addresses in packed 20-byte form (the cache's
+        storage format; convert with eth_utils.to_checksum_address)
     """
     users = set()
+    pack = _pack_address
+    update = users.update
+    # Resolve the event-name dispatch once — the per-log if/elif chain and
+    # hasattr probing cost more than the extraction itself on big scans
+    field_groups = _EVENT_USER_FIELDS.get(event_name, _GENERIC_USER_FIELDS)
 
     for log in logs:
-        # Brownie logs have event parameters in log['args'] or log.args
-        args = log.get('args') if hasattr(log, 'get') else getattr(log, 'args', None)
+        args = log.get('args')
         if not args:
             continue
-
-        if event_name == "Transfer":
-            # Transfer events have 'sender'/'from' and 'receiver'/'to'
-            from_addr = args.get('sender') or args.get('from') or args.get('_from')
-            to_addr = args.get('receiver') or args.get('to') or args.get('_to')
-
-            if from_addr:
-                users.add(from_addr)
-            if to_addr:
-                users.add(to_addr)
-
-        elif event_name == "Staked":
-            # Staked events typically have 'account' field
-            account = args.get('account')
-            if account:
-                users.add(account)
-
-        elif event_name == "CreateEscrow":
-            # CreateEscrow has 'user' and 'escrow' fields
-            user = args.get('user')
-            escrow = args.get('escrow')
-            if user:
-                users.add(user)
-            if escrow:
-                users.add(escrow)
-
-        elif event_name == "Deposited":
-            # Deposited events have 'user' field
-            user = args.get('user')
-            if user:
-                users.add(user)
-
-        else:
-            # Generic fallback - try common field names
-            for field in ['sender', 'receiver', 'from', 'to', 'account', 'user', 'address', '_from', '_to']:
-                addr = args.get(field)
-                if addr:
-                    users.add(addr)
+        # One C-level set_update per log instead of a guarded add per slot
+        update(
+            pack(addr)
+            for fields in field_groups
+            if (addr := next((a for a in map(args.get, fields) if a), None))
+        )
 
     return users
 
 
 def clear_cache() -> None:
     """Clear all cached data."""
-    if CACHE_FILE.exists():
-        CACHE_FILE.unlink()
-        print(f"Cache cleared: {CACHE_FILE}")
-    else:
+    global _cache_data
+    with _cache_lock:
+        _cache_data = None
+    cleared = False
+    # Remove the legacy JSON too — load_cache migrates from it whenever the
+    # pickle is absent, so leaving it behind would resurrect the old data
+    for cache_file in (CACHE_FILE, LEGACY_CACHE_FILE):
+        if cache_file.exists():
+            cache_file.unlink()
+            print(f"Cache cleared: {cache_file}")
+            cleared = True
+    if not cleared:
         print("No cache file to clear")
 
 
@@ -310,8 +437,8 @@ def get_cache_stats() -> Dict[str, Any]:
     Returns:
         Dict with cache statistics
     """
-    cache = load_cache()
-    caches = cache.get("caches", {})
+    with _cache_lock:
+        caches = dict(_get_cache().get("caches", {}))
 
     total_users = sum(len(entry["users"]) for entry in caches.values())
 
@@ -1,30 +1,189 @@
 import json
-from brownie import web3
-from itertools import zip_longest
-from eth_utils import encode_hex
-from eth_abi.packed import encode_packed
+import multiprocessing
+import os
+import struct
+from eth_hash.auto import keccak
+from eth_utils import encode_hex, to_checksum_address
 from config import Config
 
+# Below this leaf count the IPC overhead of a worker pool outweighs the
+# hashing work, so leaves are hashed sequentially.
+PARALLEL_MIN_LEAVES = 4096
+
+# Claim leaf layout is fixed (20-byte address || 32-byte index || 32-byte
+# amount), so the format is compiled once and each pack is a single C call
+# instead of a trip through eth-abi's type-resolution machinery
+_LEAF_STRUCT = struct.Struct('>20s32s32s')
+
+# Layers with at least this many pairs are hashed across worker processes;
+# smaller layers stay sequential to amortize IPC.
+PARALLEL_MIN_PAIRS = 1024
+
+
+def _leaf_hash(el):
+    """Keccak a single leaf, accepting raw bytes or a hex string.
+
+    Decodes hex by hand and calls the C-backed keccak — web3.keccak's
+    hexstr path re-validates and normalizes the input on every call.
+    """
+    if isinstance(el, (bytes, bytearray)):
+        return keccak(el)
+    return keccak(bytes.fromhex(el[2:] if el.startswith('0x') else el))
+
+
+def _hash_leaf_chunk(leaves):
+    """Hash a chunk of leaves (bytes or hex). Runs in worker processes."""
+    # Imported here so workers don't need brownie's connected web3 instance
+    from eth_hash.auto import keccak
+    return [
+        keccak(el if isinstance(el, (bytes, bytearray)) else bytes.fromhex(el[2:] if el.startswith('0x') else el))
+        for el in leaves
+    ]
+
+
+def _hash_pair_chunk(buf):
+    """Hash consecutive 64-byte pairs of a layer slice. Runs in worker processes."""
+    from eth_hash.auto import keccak
+    out = bytearray(len(buf) // 2)
+    for i in range(0, len(buf), 64):
+        a = bytes(buf[i:i + 32])
+        b = bytes(buf[i + 32:i + 64])
+        out[i >> 1:(i >> 1) + 32] = keccak(a + b if a < b else b + a)
+    return bytes(out)
+
+
+def _build_layers(leaves):
+    """
+    Build every tree layer bottom-up over contiguous byte buffers.
+
+    Each layer is a single bytearray of packed 32-byte nodes rather than a
+    list of bytes objects — pair inputs sit on adjacent cache lines and no
+    Python object is allocated per intermediate node. The C-backed keccak is
+    fed raw pair concatenations directly (web3.keccak adds per-call input
+    normalization that dominates the hash itself at tree scale). Pair
+    ordering matches combined_hash (lexicographically smaller half first,
+    odd tail promoted unchanged).
+
+    Pair hashing is independent within a layer, so the large bottom layers
+    — which carry nearly all of the total work — are split into contiguous
+    chunks and hashed across a process pool.
+    """
+    layer = bytearray(b"".join(leaves))
+    layers = [layer]
+    n = len(leaves)
+    num_workers = os.cpu_count() or 1
+    pool = None
+    try:
+        while n > 1:
+            pairs = n // 2
+            paired_bytes = pairs * 64
+            nxt = bytearray(32 * ((n + 1) // 2))
+            if pairs >= PARALLEL_MIN_PAIRS and num_workers >= 2:
+                if pool is None:
+                    pool = multiprocessing.Pool(num_workers)
+                pairs_per_chunk = (pairs + num_workers - 1) // num_workers
+                chunk_bytes = pairs_per_chunk * 64
+                # Cap the last slice at paired_bytes so a promoted odd tail
+                # never leaks into a worker chunk
+                chunks = [
+                    bytes(layer[i:min(i + chunk_bytes, paired_bytes)])
+                    for i in range(0, paired_bytes, chunk_bytes)
+                ]
+                nxt[:paired_bytes // 2] = b"".join(pool.map(_hash_pair_chunk, chunks))
+            else:
+                from eth_hash.auto import keccak
+                for i in range(0, paired_bytes, 64):
+                    a = bytes(layer[i:i + 32])
+                    b = bytes(layer[i + 32:i + 64])
+                    nxt[i >> 1:(i >> 1) + 32] = keccak(a + b if a < b else b + a)
+            if n % 2:
+                nxt[-32:] = layer[-32:]
+            n = (n + 1) // 2
+            layers.append(nxt)
+            layer = nxt
+    finally:
+        if pool is not None:
+            pool.close()
+    return layers
+
+
+def _layer_node(layer, idx):
+    """Slice node idx out of a packed layer buffer, or None past the end."""
+    offset = idx * 32
+    if offset >= len(layer):
+        return None
+    return bytes(layer[offset:offset + 32])
+
+
 class MerkleTree:
     def __init__(self, elements):
-        self.elements = sorted(set(web3.keccak(hexstr=el) for el in elements))
-        self.layers = MerkleTree.get_layers(self.elements)
+        self.elements = sorted(set(MerkleTree._hash_leaves(list(elements))))
+        # Leaf hash -> position, so proof lookups are O(1) instead of a
+        # linear scan of the leaf list per proof
+        self._index = {el: i for i, el in enumerate(self.elements)}
+        self.layers = _build_layers(self.elements)
+
+    @staticmethod
+    def _hash_leaves(elements):
+        """
+        Keccak every leaf, fanning out across cores for large trees.
+
+        Leaf hashing is embarrassingly parallel (each leaf is an independent
+        84-byte keccak), so big drops get close to a cores-x speedup here.
+        """
+        num_workers = os.cpu_count() or 1
+        if len(elements) < PARALLEL_MIN_LEAVES or num_workers < 2:
+            return [_leaf_hash(el) for el in elements]
+
+        chunk_size = (len(elements) + num_workers - 1) // num_workers
+        chunks = [elements[i:i + chunk_size] for i in range(0, len(elements), chunk_size)]
+        with multiprocessing.Pool(num_workers) as pool:
+            return [leaf for chunk in pool.imap(_hash_leaf_chunk, chunks) for leaf in chunk]
 
     @property
     def root(self):
-        return self.layers[-1][0]
+        return bytes(self.layers[-1])
 
     def get_proof(self, el):
-        el = web3.keccak(hexstr=el)
-        idx = self.elements.index(el)
+        el = _leaf_hash(el)
+        idx = self._index[el]
         proof = []
         for layer in self.layers:
             pair_idx = idx + 1 if idx % 2 == 0 else idx - 1
-            if pair_idx < len(layer):
-                proof.append(encode_hex(layer[pair_idx]))
+            sibling = _layer_node(layer, pair_idx)
+            if sibling is not None:
+                proof.append(encode_hex(sibling))
             idx //= 2
         return proof
 
+    def get_all_proofs(self, elements):
+        """
+        Build proofs for every element in one pass over the cached layers.
+
+        Equivalent to calling get_proof per element, but each proof is pure
+        array indexing into the shared sibling hashes — no per-call linear
+        scan of the leaf list and no re-hashing.
+
+        Args:
+            elements: The same (unhashed) elements passed to the constructor
+
+        Returns:
+            List of proofs aligned with the order of `elements`
+        """
+        index_of = self._index
+        inner_layers = self.layers[:-1] if len(self.layers) > 1 else []
+        proofs = []
+        for el in elements:
+            idx = index_of[_leaf_hash(el)]
+            proof = []
+            for layer in inner_layers:
+                sibling = _layer_node(layer, idx ^ 1)
+                if sibling is not None:
+                    proof.append(encode_hex(sibling))
+                idx >>= 1
+            proofs.append(proof)
+        return proofs
+
     @staticmethod
     def get_layers(elements):
         layers = [elements]
@@ -34,9 +193,15 @@ class MerkleTree:
 
     @staticmethod
     def get_next_layer(elements):
-        return [
-            MerkleTree.combined_hash(a, b) for a, b in zip_longest(elements[::2], elements[1::2])
+        # Pair by stepped index instead of zip_longest over two slices —
+        # no slice copies, no padding sentinel for the odd tail
+        layer = [
+            MerkleTree.combined_hash(elements[i], elements[i + 1])
+            for i in range(0, len(elements) - 1, 2)
         ]
+        if len(elements) % 2:
+            layer.append(elements[-1])
+        return layer
 
     @staticmethod
     def combined_hash(a, b):
@@ -44,7 +209,9 @@ class MerkleTree:
             return b
         if b is None:
             return a
-        return web3.keccak(b"".join(sorted([a, b])))
+        # C-backed keccak fed the raw concatenation — web3.keccak's per-call
+        # input normalization dominates the hash itself at tree scale
+        return keccak(a + b if a < b else b + a)
     
 def create_merkle(user_amount_data, total_distribution, alloc_type):
     # Convert values to integers and calculate ratio using integer division
@@ -56,34 +223,60 @@ def create_merkle(user_amount_data, total_distribution, alloc_type):
         for k, v in user_amount_data.items()
     }
     
-    addresses = sorted(user_amount_data, key=lambda k: user_amount_data[k], reverse=True)
-    while sum(user_amount_data.values()) < total_distribution:
-        diff = total_distribution - sum(user_amount_data.values())
-        user_amount_data[addresses[len(addresses) - 1]] += diff
-    assert sum(user_amount_data.values()) == total_distribution
+    addresses = sorted(user_amount_data, key=user_amount_data.__getitem__, reverse=True)
+    # Floor division can only undershoot, so one top-up of the running total
+    # settles the rounding dust — no O(N) re-summation per loop iteration
+    current_total = sum(user_amount_data.values())
+    if current_total < total_distribution:
+        user_amount_data[addresses[-1]] += total_distribution - current_total
+        current_total = total_distribution
+    assert current_total == total_distribution
     
     elements = [
         (account, index, user_amount_data[account]) for index, account in enumerate(addresses)
     ]
-    nodes = [encode_hex(encode_packed(["address", "uint", "uint"], el)) for el in elements]
+    # Raw 84-byte leaves go straight into the tree — the old
+    # encode_packed + encode_hex round-trip re-resolved the ABI types per
+    # element and doubled leaf memory just to decode the hex again
+    nodes = [
+        _LEAF_STRUCT.pack(bytes.fromhex(account[2:]), index.to_bytes(32, 'big'), amount.to_bytes(32, 'big'))
+        for account, index, amount in elements
+    ]
     tree = MerkleTree(nodes)
+    # One pass over the cached layers yields every proof; calling get_proof
+    # per user re-walks the same sibling slices N times over
+    proofs = tree.get_all_proofs(nodes)
 
-    distribution = {
-        "merkle_root": encode_hex(tree.root),
-        "token_total": sum(user_amount_data.values()),
-        "claims": {
-            web3.to_checksum_address(user): {
-                "index": index,
-                "amount": str(amount),
-                "proof": tree.get_proof(nodes[index]),
-            }
-            for user, index, amount in elements
-        },
-    }
+    # Plain eth_utils checksummer — web3.to_checksum_address wraps it in a
+    # validation layer that costs a second keccak-sized pass over the set
+    _cs = to_checksum_address
+    merkle_root = encode_hex(tree.root)
+    token_total = current_total
 
-    # Write the distribution data to a JSON file
+    # Stream the distribution one claim at a time instead of serializing the
+    # whole dict in one json.dump — the monolithic indented output buffer
+    # doubles peak memory on large claim sets
+    _dumps = lambda obj: json.dumps(obj, separators=(',', ':'))
+    claims = {}
+    num_claims = len(elements)
     with open(Config.get_merkle_file(alloc_type), 'w') as json_file:
-        json.dump(distribution, json_file, indent=4)
-    print(f'Distribution successfully written for {len(distribution["claims"])} users')
-    print(f"base merkle root: {encode_hex(tree.root)}")
+        json_file.write('{\n')
+        json_file.write(f'  "merkle_root": {_dumps(merkle_root)},\n')
+        json_file.write(f'  "token_total": {token_total},\n')
+        json_file.write('  "claims": {\n')
+        for i, (user, index, amount) in enumerate(elements):
+            checksummed = _cs(user)
+            claim = {"index": index, "amount": str(amount), "proof": proofs[index]}
+            claims[checksummed] = claim
+            json_file.write(f'    {_dumps(checksummed)}: {_dumps(claim)}')
+            json_file.write(',\n' if i < num_claims - 1 else '\n')
+        json_file.write('  }\n}\n')
+
+    distribution = {
+        "merkle_root": merkle_root,
+        "token_total": token_total,
+        "claims": claims,
+    }
+    print(f'Distribution successfully written for {len(claims)} users')
+    print(f"base merkle root: {merkle_root}")
     return distribution
\ No newline at end of file
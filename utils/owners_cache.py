@@ -0,0 +1,55 @@
+"""
+Persistent cache for Summer guard proxy-ownership lookups.
+
+Most snapshot accounts are EOAs for which guard.owners() returns the zero
+address, so the bulk of the eth_call volume is negative results that never
+change. Caching them (keyed by guard + account) lets re-runs query only
+addresses we haven't seen before.
+"""
+import json
+from pathlib import Path
+from typing import Dict
+
+CACHE_DIR = Path(__file__).parent.parent / "data" / "cache"
+OWNERS_CACHE_FILE = CACHE_DIR / "owners_cache.json"
+
+
+def load_owners(guard_address: str) -> Dict[str, str]:
+    """
+    Load cached ownership results for a guard contract.
+
+    Args:
+        guard_address: Address of the guard contract
+
+    Returns:
+        Dict mapping lowercase account -> owner address
+    """
+    if not OWNERS_CACHE_FILE.exists():
+        return {}
+
+    with open(OWNERS_CACHE_FILE, 'r') as f:
+        cache = json.load(f)
+    return cache.get("guards", {}).get(guard_address.lower(), {})
+
+
+def update_owners(guard_address: str, owners: Dict[str, str]) -> None:
+    """
+    Merge new ownership results into the cache and persist it.
+
+    Args:
+        guard_address: Address of the guard contract
+        owners: Dict mapping account -> owner address
+    """
+    if OWNERS_CACHE_FILE.exists():
+        with open(OWNERS_CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+    else:
+        cache = {"version": "1.0", "guards": {}}
+
+    guard_entry = cache["guards"].setdefault(guard_address.lower(), {})
+    for account, owner in owners.items():
+        guard_entry[account.lower()] = str(owner)
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(OWNERS_CACHE_FILE, 'w') as f:
+        json.dump(cache, f, indent=2)